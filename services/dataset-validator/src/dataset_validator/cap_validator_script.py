@@ -11,7 +11,6 @@ Interface contract (same as cellxgene/hca-schema validator scripts):
   - Prints a JSON object to stdout: {"valid": bool, "errors": [...], "warnings": [...]}
 """
 
-import io
 import json
 import sys
 
@@ -37,10 +36,11 @@ def main() -> None:
     valid = False
     errors: list[str] = []
 
-    # Redirect stdout during validation so that any prints from
-    # UploadValidator don't corrupt our JSON output.
+    # Redirect stdout to stderr during validation so that any prints from
+    # UploadValidator don't corrupt our JSON output. Writing straight to stderr
+    # avoids buffering everything the validator prints in memory.
     real_stdout = sys.stdout
-    sys.stdout = io.StringIO()
+    sys.stdout = sys.stderr
     try:
         uv = UploadValidator(file_path)
         uv.validate()
@@ -50,11 +50,7 @@ def main() -> None:
     except (CapException, Exception) as e:
         errors.append(f"Encountered an unexpected error while calling CAP validator: {e}")
     finally:
-        # Capture anything the validator printed, then restore stdout
-        captured = sys.stdout.getvalue()
         sys.stdout = real_stdout
-        if captured:
-            print(captured, file=sys.stderr)
 
     print(json.dumps({"valid": valid, "errors": errors, "warnings": []}))
 
@@ -11,13 +11,11 @@ HCA validation tools, and returns the validation results as JSON.
 import json
 import logging
 import os
-import traceback
-from dataclasses import asdict
+from dataclasses import fields
 from http import HTTPStatus
+from pathlib import Path
 from typing import Any
 
-import psutil
-
 from hca_validation.entry_sheet_validator.process_sheet import process_google_sheet
 
 # Third-party / local imports
@@ -36,21 +34,47 @@ logger.setLevel(logging.ERROR)
 # ---------------------------------------------------------------------------
 # Known validation error codes mapped to appropriate HTTP status responses.
 # This avoids repetitive if/elif chains and simplifies future maintenance.
-ERROR_TO_STATUS: dict[str, HTTPStatus] = {
+# Values are plain ints so that lookups don't need to resolve the enum value.
+ERROR_TO_STATUS: dict[str, int] = {
     # Authentication / authorization errors
-    "auth_missing": HTTPStatus.UNAUTHORIZED,
-    "auth_unresolved": HTTPStatus.UNAUTHORIZED,
-    "auth_invalid_format": HTTPStatus.UNAUTHORIZED,
-    "auth_error": HTTPStatus.UNAUTHORIZED,
+    "auth_missing": HTTPStatus.UNAUTHORIZED.value,
+    "auth_unresolved": HTTPStatus.UNAUTHORIZED.value,
+    "auth_invalid_format": HTTPStatus.UNAUTHORIZED.value,
+    "auth_error": HTTPStatus.UNAUTHORIZED.value,
     # Permission issues
-    "permission_denied": HTTPStatus.FORBIDDEN,
+    "permission_denied": HTTPStatus.FORBIDDEN.value,
     # Resource not found
-    "sheet_not_found": HTTPStatus.NOT_FOUND,
-    "worksheet_not_found": HTTPStatus.NOT_FOUND,
+    "sheet_not_found": HTTPStatus.NOT_FOUND.value,
+    "worksheet_not_found": HTTPStatus.NOT_FOUND.value,
     # Service unavailable
-    "max_api_retries": HTTPStatus.SERVICE_UNAVAILABLE,
+    "max_api_retries": HTTPStatus.SERVICE_UNAVAILABLE.value,
 }
 
+# Field names of SheetErrorInfo, for building shallow dicts of errors in the response
+ERROR_INFO_FIELDS = tuple(field.name for field in fields(SheetErrorInfo))
+
+# Headers for API Gateway responses, shared across invocations
+RESPONSE_HEADERS = {"Content-Type": "application/json", "Access-Control-Allow-Origin": "*"}
+
+# Encoder for API Gateway response bodies, created once and emitting compact JSON without whitespace
+RESPONSE_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+# Constant response for requests without a sheet_id, serialized once at import
+MISSING_SHEET_ID_RESPONSE = {
+    "statusCode": HTTPStatus.BAD_REQUEST.value,
+    "body": RESPONSE_ENCODER.encode({"error": "Missing required parameter: sheet_id"}),
+    "headers": RESPONSE_HEADERS,
+}
+
+# Memory usage is only measured and reported when explicitly requested, to keep it off the hot path
+REPORT_MEMORY = os.environ.get("HCA_REPORT_MEMORY") == "1"
+
+# Size of a memory page in MB, for converting the page counts reported by /proc/self/statm
+PAGE_SIZE_MB = os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+# Lambda memory limit in MB if available, which is fixed for the lifetime of the container
+MEMORY_LIMIT_MB = int(os.environ.get("AWS_LAMBDA_FUNCTION_MEMORY_SIZE", 0))
+
 
 def extract_validation_errors(sheet_id: str, bionetwork: str | None = None) -> tuple[SheetValidationResult, int]:
     """
@@ -81,7 +105,7 @@ def extract_validation_errors(sheet_id: str, bionetwork: str | None = None) -> t
         if error_code is None:
             http_status_code = HTTPStatus.OK.value
         else:
-            http_status_code = ERROR_TO_STATUS.get(error_code, HTTPStatus.BAD_REQUEST).value
+            http_status_code = ERROR_TO_STATUS.get(error_code, HTTPStatus.BAD_REQUEST.value)
     except ValueError as ve:
         # Guard violations (e.g., missing required params) → 400 Bad Request
         error_msg = str(ve)
@@ -117,18 +141,54 @@ def extract_validation_errors(sheet_id: str, bionetwork: str | None = None) -> t
 
 def get_memory_usage():
     """Get current memory usage information"""
-    # Get process memory info
-    process = psutil.Process(os.getpid())
-    memory_info = process.memory_info()
-    memory_mb = memory_info.rss / (1024 * 1024)  # Convert to MB
-
-    # Get Lambda memory limit if available
-    memory_limit = int(os.environ.get("AWS_LAMBDA_FUNCTION_MEMORY_SIZE", 0))
+    # Get process resident set size, the second field of /proc/self/statm, in pages
+    rss_pages = int(Path("/proc/self/statm").read_text().split()[1])
+    memory_mb = rss_pages * PAGE_SIZE_MB  # Convert to MB
 
     return {
         "memory_used_mb": round(memory_mb, 2),
-        "memory_limit_mb": memory_limit,
-        "memory_utilization_percent": round((memory_mb / memory_limit * 100), 2) if memory_limit else None,
+        "memory_limit_mb": MEMORY_LIMIT_MB,
+        "memory_utilization_percent": round((memory_mb / MEMORY_LIMIT_MB * 100), 2) if MEMORY_LIMIT_MB else None,
+    }
+
+
+def format_response(data: dict[str, Any], status_code: int, is_api_gateway: bool) -> dict[str, Any]:
+    """
+    Format response data for the way the Lambda function was invoked.
+
+    Args:
+        data: Response data
+        status_code: HTTP status code of the response
+        is_api_gateway: Whether the function was called via API Gateway
+
+    Returns:
+        The API Gateway proxy response wrapping the JSON-encoded data, or the data itself for direct invocations
+    """
+    if is_api_gateway:
+        return {
+            "statusCode": status_code,
+            "body": RESPONSE_ENCODER.encode(data),
+            "headers": RESPONSE_HEADERS,
+        }
+    # Direct Lambda invocation
+    return data
+
+
+def invalid_body_response(reason: str) -> dict[str, Any]:
+    """
+    Make the API Gateway response for a request body that couldn't be parsed.
+
+    Args:
+        reason: Description of the problem with the body
+
+    Returns:
+        Bad request response reporting the reason
+    """
+    logger.warning("Error parsing request body: %s", reason)
+    return {
+        "statusCode": HTTPStatus.BAD_REQUEST.value,
+        "body": RESPONSE_ENCODER.encode({"error": f"Invalid request body: {reason}"}),
+        "headers": RESPONSE_HEADERS,
     }
 
 
@@ -143,104 +203,100 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     Returns:
         Dictionary with validation results including any validation errors
     """
+    # Warm-up invocations (e.g. from a scheduled rule) only keep the container and its imports loaded
+    if isinstance(event, dict) and event.get("__warm__"):
+        return {"statusCode": HTTPStatus.NO_CONTENT.value}
+
     # Log initial memory usage
-    initial_memory = get_memory_usage()
-    logger.info(f"Initial memory usage: {initial_memory}")
-    logger.info(f"Event: {event}")
+    if REPORT_MEMORY:
+        initial_memory = get_memory_usage()
+        logger.info("Initial memory usage: %s", initial_memory)
+    logger.info("Event: %s", event)
+
+    # Check if this was called via API Gateway (event has 'httpMethod' or 'requestContext'); other events, including
+    # ones that aren't objects, are treated as direct invocations
+    is_api_gateway = isinstance(event, dict) and ("httpMethod" in event or "requestContext" in event)
 
     try:
         # Check if this is an API Gateway request
         if "body" in event:
-            try:
-                # Parse the body if it's a string (from API Gateway)
-                body = json.loads(event["body"]) if isinstance(event["body"], str) else event["body"]
-
-                sheet_id = body.get("sheet_id")
-                bionetwork = body.get("bionetwork")
-            except Exception as e:
-                logger.warning(f"Error parsing request body: {e!s}")
-                return {
-                    "statusCode": HTTPStatus.BAD_REQUEST.value,
-                    "body": json.dumps({"error": f"Invalid request body: {e!s}"}),
-                    "headers": {"Content-Type": "application/json", "Access-Control-Allow-Origin": "*"},
-                }
+            body = event["body"]
+            # Parse the body if it's a string (from API Gateway)
+            if isinstance(body, str):
+                try:
+                    body = json.loads(body)
+                except json.JSONDecodeError as e:
+                    return invalid_body_response(str(e))
+            if not isinstance(body, dict):
+                return invalid_body_response("expected a JSON object")
         else:
             # Direct Lambda invocation
-            sheet_id = event.get("sheet_id")
-            bionetwork = event.get("bionetwork")
+            body = event
+
+        sheet_id = body.get("sheet_id")
+        bionetwork = body.get("bionetwork")
 
         if not sheet_id:
-            return {
-                "statusCode": HTTPStatus.BAD_REQUEST.value,
-                "body": json.dumps({"error": "Missing required parameter: sheet_id"}),
-                "headers": {"Content-Type": "application/json", "Access-Control-Allow-Origin": "*"},
-            }
+            return MISSING_SHEET_ID_RESPONSE
 
         # Log memory usage before validation
-        pre_validation_memory = get_memory_usage()
-        logger.info(f"Memory usage before validation: {pre_validation_memory}")
+        if REPORT_MEMORY:
+            pre_validation_memory = get_memory_usage()
+            logger.info("Memory usage before validation: %s", pre_validation_memory)
 
         # Extract validation errors using the entry sheet validator
         validation_result, http_status_code = extract_validation_errors(sheet_id, bionetwork)
         spreadsheet_metadata = validation_result.spreadsheet_metadata
 
         # Log memory usage after validation
-        post_validation_memory = get_memory_usage()
-        logger.info(f"Memory usage after validation: {post_validation_memory}")
+        if REPORT_MEMORY:
+            post_validation_memory = get_memory_usage()
+            logger.info("Memory usage after validation: %s", post_validation_memory)
         logger.info(
-            f"Validation completed with error_code: {validation_result.error_code}, "
-            f"http_status_code: {http_status_code}"
+            "Validation completed with error_code: %s, http_status_code: %s",
+            validation_result.error_code,
+            http_status_code,
         )
 
-        # Prepare the response data
-        response_data = {
-            "sheet_id": sheet_id,
-            "sheet_title": None if spreadsheet_metadata is None else spreadsheet_metadata.spreadsheet_title,
-            "last_updated": None
-            if spreadsheet_metadata is None
-            else {
+        # Get the sheet details, checking for metadata once
+        if spreadsheet_metadata is None:
+            sheet_title = last_updated = can_edit = None
+        else:
+            sheet_title = spreadsheet_metadata.spreadsheet_title
+            last_updated = {
                 "date": spreadsheet_metadata.last_updated_date,
                 "by": spreadsheet_metadata.last_updated_by,
                 "by_email": spreadsheet_metadata.last_updated_email,
-            },
-            "can_edit": None if spreadsheet_metadata is None else spreadsheet_metadata.can_edit,
-            "errors": [asdict(e) for e in validation_result.errors],
+            }
+            can_edit = spreadsheet_metadata.can_edit
+
+        # Prepare the response data
+        response_data = {
+            "sheet_id": sheet_id,
+            "sheet_title": sheet_title,
+            "last_updated": last_updated,
+            "can_edit": can_edit,
+            "errors": [{name: getattr(e, name) for name in ERROR_INFO_FIELDS} for e in validation_result.errors],
             "valid": len(validation_result.errors) == 0,
             "error_code": validation_result.error_code,
             "summary": validation_result.summary,
-            "memory_usage": {
+        }
+        if REPORT_MEMORY:
+            response_data["memory_usage"] = {
                 "initial": initial_memory,
                 "pre_validation": pre_validation_memory,
                 "post_validation": post_validation_memory,
-            },
-        }
-
-        # Check if this was called via API Gateway (event has 'httpMethod')
-        if "httpMethod" in event or "requestContext" in event:
-            return {
-                "statusCode": http_status_code,
-                "body": json.dumps(response_data),
-                "headers": {"Content-Type": "application/json", "Access-Control-Allow-Origin": "*"},
             }
-        # Direct Lambda invocation
-        return response_data
+
+        return format_response(response_data, http_status_code, is_api_gateway)
     except Exception as e:
-        # Log the error
-        logger.error(f"Error: {e!s}")
-        logger.error(traceback.format_exc())
-
-        # Prepare error response
-        error_response = {"error": str(e), "traceback": traceback.format_exc()}
-
-        # Check if this was called via API Gateway
-        if "httpMethod" in event or "requestContext" in event:
-            return {
-                "statusCode": 500,
-                "body": json.dumps(error_response),
-                "headers": {"Content-Type": "application/json", "Access-Control-Allow-Origin": "*"},
-            }
-        # Direct Lambda invocation
-        return error_response
+        # Log the error along with its traceback, which is kept out of the response
+        logger.exception("Error: %s", e)
+
+        # Prepare error response, with the request ID for finding the logged traceback
+        error_response = {"error": str(e), "request_id": getattr(context, "aws_request_id", None)}
+
+        return format_response(error_response, HTTPStatus.INTERNAL_SERVER_ERROR.value, is_api_gateway)
 
 
 # For local testing
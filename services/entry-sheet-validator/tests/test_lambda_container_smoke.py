@@ -55,6 +55,25 @@ def test_lambda_container_smoke(lambda_container):
     assert "valid" in body_data or "error" in body_data
 
 
+def test_lambda_warm_up_event(lambda_container):
+    """Warm-up: a `__warm__` event returns 204 immediately, without a sheet_id or credentials."""
+    event = {"__warm__": True}
+    response = requests.post("http://localhost:9000/2015-03-31/functions/function/invocations", json=event, timeout=10)
+    assert response.status_code == 200
+    assert response.json() == {"statusCode": 204}
+
+
+def test_lambda_non_object_event(lambda_container):
+    """A bare JSON string event is handled by the function and reported as an error, not an unhandled exception."""
+    response = requests.post(
+        "http://localhost:9000/2015-03-31/functions/function/invocations", json="not an object", timeout=10
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert "error" in data
+    assert "errorType" not in data
+
+
 def test_lambda_happy_path(lambda_container):
     """Happy path: with credentials present, a valid public sheet_id must return 200 and a boolean `valid`.
 
@@ -3,9 +3,9 @@ import dataclasses
 from linkml_runtime import SchemaView
 from linkml_runtime.linkml_model.meta import ClassDefinition
 
-from hca_validation.schema_utils import get_entity_class_name, load_schemaview
+from hca_validation.schema_utils import get_entity_class_name
 
-from .validate_sheet import SheetErrorInfo
+from .validate_sheet import SheetErrorInfo, hca_schemaview
 
 # Spreadsheet values to identify possible fixes for
 # Mapping tuple of entity type, slot, and input value to corrected value
@@ -54,6 +54,4 @@ def add_fixes_to_errors(errors: list[SheetErrorInfo], bionetwork: str | None) ->
         List of errors with fixes added where possible
     """
 
-    schemaview = load_schemaview()
-
-    return [add_fix_to_error_if_available(error, bionetwork, schemaview) for error in errors]
+    return [add_fix_to_error_if_available(error, bionetwork, hca_schemaview) for error in errors]
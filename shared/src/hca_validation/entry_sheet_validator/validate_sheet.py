@@ -1,16 +1,20 @@
 #!/usr/bin/env python
 
+import functools
 import json
+import logging
+import os
 import re
 import sys
 from collections.abc import Mapping
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
 # Import libraries for Google API access
 import gspread
+import numpy as np
 import pandas as pd
 import requests
 import requests.adapters
@@ -21,13 +25,18 @@ from dotenv import load_dotenv
 from google.auth.credentials import Credentials
 from google.auth.transport.requests import AuthorizedSession
 from google.oauth2 import service_account
+from googleapiclient import discovery
+from googleapiclient.errors import HttpError as GoogleHttpError
 from linkml_runtime import SchemaView
 from pydantic import ValidationError
 
+from hca_validation.schema_utils import get_entity_class_name, load_schemaview
+from hca_validation.validator import validate, validate_id_uniqueness, validate_referential_integrity
+
 from .common import default_entity_types
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiInstances:
     """Container for instances of APIs used in the validation process."""
 
@@ -35,7 +44,17 @@ class ApiInstances:
     drive: Any
 
 
-@dataclass
+@functools.lru_cache(maxsize=1024)
+def get_column_letter(column_index: int) -> str:
+    """
+    Get the A1 notation letters for a 1-based column index
+
+    Letters are cached, since worksheets of the same spreadsheet template share most of their column indices
+    """
+    return gspread.utils.rowcol_to_a1(1, column_index)[:-1]
+
+
+@dataclass(slots=True)
 class WorksheetInfo:
     """Container for Google Sheets worksheet data and metadata."""
 
@@ -43,15 +62,36 @@ class WorksheetInfo:
     worksheet_id: int
     source_columns: list[Any]
     source_rows_start_index: int
+    # Mapping from column name to column letter, built once so that locating errors doesn't scan the columns
+    _column_letters: dict[Any, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._column_letters = {}
+        for column_index, column in enumerate(self.source_columns, start=1):
+            # Use the first occurrence of a repeated column name, as a search of the columns would
+            if column not in self._column_letters:
+                self._column_letters[column] = get_column_letter(column_index)
+
+    def find_a1(self, row, column) -> str | None:
+        """
+        Get A1 notation given a 1-based row index and a column name, or None if the worksheet has no such column
+        """
+        column_letter = self._column_letters.get(column)
+        if column_letter is None:
+            return None
+        return f"{column_letter}{self.source_rows_start_index + row}"
 
     def get_a1(self, row, column):
         """
         Get A1 notation given a 1-based row index and a column name
         """
-        return gspread.utils.rowcol_to_a1(self.source_rows_start_index + row, self.source_columns.index(column) + 1)
+        a1 = self.find_a1(row, column)
+        if a1 is None:
+            raise ValueError(f"{column!r} is not a column of worksheet {self.worksheet_id}")
+        return a1
 
 
-@dataclass
+@dataclass(slots=True)
 class SpreadsheetMetadata:
     """Container for Google Sheet metadata"""
 
@@ -62,7 +102,7 @@ class SpreadsheetMetadata:
     can_edit: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class SpreadsheetInfo:
     """Container for Google Sheet data and metadata."""
 
@@ -70,17 +110,24 @@ class SpreadsheetInfo:
     worksheets: list[WorksheetInfo]
 
 
-@dataclass
 class SheetReadError(Exception):
     """Exception raised when reading a Google Sheet fails."""
 
-    error_code: str
-    error_message: str | None = None
-    spreadsheet_metadata: SpreadsheetMetadata | None = None
-    worksheet_id: int | None = None
-
-
-@dataclass
+    def __init__(
+        self,
+        error_code: str,
+        error_message: str | None = None,
+        spreadsheet_metadata: SpreadsheetMetadata | None = None,
+        worksheet_id: int | None = None,
+    ):
+        super().__init__(error_code if error_message is None else f"{error_code}: {error_message}")
+        self.error_code = error_code
+        self.error_message = error_message
+        self.spreadsheet_metadata = spreadsheet_metadata
+        self.worksheet_id = worksheet_id
+
+
+@dataclass(slots=True)
 class SheetErrorInfo:
     """Container for info regarding an error that occurred while reading and validating a Google Sheet."""
 
@@ -95,7 +142,7 @@ class SheetErrorInfo:
     input_fix: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SheetValidationResult:
     """Container for general info on the outcome of a Google Sheet validation."""
 
@@ -142,14 +189,32 @@ sheet_structure_by_entity_type = {
     "sample": {"sheet_index": 2, "primary_key_field": "sample_id"},
 }
 
+# An integer should consist of an optional negative sign, followed by either a nonzero number of non-separated digits,
+# or 1-3 digits followed by a nonzero number of comma-separated three-digit groups
+integer_value_re = re.compile(r"^-?(?:\d+|\d{1,3}(?:,\d{3})+)$")
+
+# Schema used to interpret and validate input values, loaded once at import so that it (and the induced class info
+# it caches) is shared by all validations in the process
+hca_schemaview = load_schemaview()
+
 # Load environment variables from .env file if it exists
 # Find project root more reliably
 project_root = Path(__file__).resolve().parents[4]  # Go up to project root
 dotenv_path = project_root / ".env"
-if dotenv_path.exists():
+# Lambda deployments never include a .env file, so skip checking for one there
+if "AWS_LAMBDA_FUNCTION_NAME" not in os.environ and dotenv_path.exists():
     load_dotenv(dotenv_path=dotenv_path)
 
 
+# Session for requests to the Secrets Lambda Extension, kept for the life of the Lambda container so that the
+# connection to the extension can be reused across invocations
+secrets_extension_session = requests.Session()
+
+# Timeout in seconds for requests to the Secrets Lambda Extension, so that an unresponsive extension can't hang the
+# invocation; the extension may need to fetch the secret from Secrets Manager on a cache miss, so this allows for that
+secrets_extension_timeout = 5
+
+
 def get_secret_from_extension(secret_name):
     """
     Retrieve a secret from the AWS Parameters and Secrets Lambda Extension.
@@ -160,11 +225,6 @@ def get_secret_from_extension(secret_name):
     Returns:
         str: The secret value, or None if there was an error.
     """
-    import logging
-    import os
-
-    import requests
-
     logger = logging.getLogger(__name__)
 
     # Constants for the Secrets Extension
@@ -177,45 +237,41 @@ def get_secret_from_extension(secret_name):
         return None
 
     try:
-        logger.info(f"Retrieving secret {secret_name} from extension...")
+        logger.info("Retrieving secret %s from extension...", secret_name)
         headers = {"X-Aws-Parameters-Secrets-Token": os.environ.get("AWS_SESSION_TOKEN", "")}
         url = f"{SECRETS_EXTENSION_ENDPOINT}={secret_name}"
 
-        response = requests.get(url, headers=headers)
+        response = secrets_extension_session.get(url, headers=headers, timeout=secrets_extension_timeout)
         response.raise_for_status()
         secret_data = response.json()
-        logger.info(f"Successfully retrieved secret {secret_name}")
+        logger.info("Successfully retrieved secret %s", secret_name)
         return secret_data.get("SecretString")
     except Exception as e:
-        logger.error(f"Error retrieving secret from extension: {e}")
+        logger.error("Error retrieving secret from extension: %s", e)
         return None
 
 
+# Retry behavior for Google API requests; Retry objects are never mutated (each retry creates a new one), so a single
+# instance can be shared by all sessions
+api_retry_config = urllib3.Retry(
+    total=4,
+    status_forcelist=(429, 500, 502, 503, 504),
+    backoff_factor=10,
+    backoff_jitter=5,
+    respect_retry_after_header=True,
+)
+
+
 def create_requests_session(credentials: Credentials) -> requests.Session:
     """
     Create a requests session with retry behavior configured
     """
     session = AuthorizedSession(gspread.utils.convert_credentials(credentials))
-    retry_cfg = urllib3.Retry(
-        total=4,
-        status_forcelist=(429, 500, 502, 503, 504),
-        backoff_factor=10,
-        backoff_jitter=5,
-        respect_retry_after_header=True,
-    )
-    session.mount("https://", requests.adapters.HTTPAdapter(max_retries=retry_cfg))
+    session.mount("https://", requests.adapters.HTTPAdapter(max_retries=api_retry_config))
     return session
 
 
 def init_apis() -> ApiInstances:
-    import logging
-    import os
-    import traceback
-
-    import gspread
-    from googleapiclient.discovery import build
-    from googleapiclient.errors import HttpError as GoogleHttpError
-
     # Configure logging
     logger = logging.getLogger(__name__)
 
@@ -243,14 +299,14 @@ def init_apis() -> ApiInstances:
         raise SheetReadError(error_code="auth_missing")
 
     # Log the length and first few characters of the credentials to verify they're present
-    logger.info(f"Service account credentials found: Length={len(service_account_json)} chars")
+    logger.info("Service account credentials found: Length=%d chars", len(service_account_json))
 
     # Check if the credentials contain unresolved secret references
     # Check for CloudFormation resolve syntax
     if service_account_json.startswith("{{resolve:"):
         logger.error(
-            f"Service account credentials were not resolved from Secrets Manager (CloudFormation syntax): "
-            f"{service_account_json[:50]}..."
+            "Service account credentials were not resolved from Secrets Manager (CloudFormation syntax): %s...",
+            service_account_json[:50],
         )
         logger.error(
             "Check that the Lambda function has the correct permissions to access the secret and that the secret "
@@ -261,8 +317,8 @@ def init_apis() -> ApiInstances:
     # Check for AWS shorthand syntax
     if service_account_json.startswith("aws:secretsmanager:"):
         logger.error(
-            f"Service account credentials were not resolved from Secrets Manager (AWS shorthand syntax): "
-            f"{service_account_json[:50]}..."
+            "Service account credentials were not resolved from Secrets Manager (AWS shorthand syntax): %s...",
+            service_account_json[:50],
         )
         logger.error(
             "Check that the Lambda function has the correct permissions to access the secret and that the secret "
@@ -270,15 +326,29 @@ def init_apis() -> ApiInstances:
         )
         raise SheetReadError(error_code="auth_unresolved")
 
+    return create_apis(service_account_json)
+
+
+@functools.lru_cache(maxsize=4)
+def create_apis(service_account_json: str) -> ApiInstances:
+    """
+    Create API instances authorized with the given service account credentials
+
+    Instances are cached by credentials, so that warm Lambda invocations skip parsing the credentials and authorizing
+    the clients again; rotated credentials simply produce a new cache entry
+    """
+    logger = logging.getLogger(__name__)
+
     try:
         # Parse the service account JSON
         logger.info("Attempting to parse service account JSON...")
         credentials_dict = json.loads(service_account_json)
 
-        # Log some non-sensitive parts of the credentials to verify structure
-        safe_keys = ["type", "project_id", "client_email", "auth_uri", "token_uri"]
-        cred_info = {k: credentials_dict.get(k) for k in safe_keys if k in credentials_dict}
-        logger.info(f"Parsed credentials structure: {json.dumps(cred_info)}")
+        # Log some non-sensitive parts of the credentials to verify structure, if debug logging is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            safe_keys = ["type", "project_id", "client_email", "auth_uri", "token_uri"]
+            cred_info = {k: credentials_dict[k] for k in safe_keys if k in credentials_dict}
+            logger.debug("Parsed credentials structure: %r", cred_info)
 
         # Verify the required fields are present
         required_fields = ["private_key", "client_email", "token_uri"]
@@ -287,12 +357,13 @@ def init_apis() -> ApiInstances:
             error_msg = f"Service account credentials missing required fields: {missing_fields}"
             logger.error(error_msg)
             logger.error(
-                f"Error: {error_msg}. Check that the service account JSON has the correct format and contains all "
-                "required fields."
+                "Error: %s. Check that the service account JSON has the correct format and contains all required "
+                "fields.",
+                error_msg,
             )
             raise SheetReadError(error_code="auth_invalid_format")
 
-        logger.info(f"Creating credentials object for service account: {credentials_dict.get('client_email')}")
+        logger.info("Creating credentials object for service account: %s", credentials_dict.get("client_email"))
 
         # Create credentials object
         try:
@@ -305,7 +376,7 @@ def init_apis() -> ApiInstances:
             )
             logger.info("Successfully created credentials object")
         except Exception as cred_error:
-            logger.error(f"Error creating Google credentials object: {cred_error}")
+            logger.error("Error creating Google credentials object: %s", cred_error)
             raise SheetReadError(error_code="auth_error") from cred_error
 
         # Authenticate with gspread
@@ -314,51 +385,47 @@ def init_apis() -> ApiInstances:
             gc = gspread.authorize(credentials, session=create_requests_session(credentials))
             logger.info("Successfully authorized with gspread")
         except Exception as auth_error:
-            logger.error(f"Error authorizing with Google Sheets API: {auth_error}")
+            logger.error("Error authorizing with Google Sheets API: %s", auth_error)
             raise SheetReadError(error_code="auth_error") from auth_error
 
         # Authenticate with Drive API
         logger.info("Authorizing with Drive API...")
         try:
-            drive = build("drive", "v3", credentials=credentials)
+            drive = discovery.build("drive", "v3", credentials=credentials)
             logger.info("Successfully authorized with Drive API")
         except Exception as auth_error:
-            logger.error(f"Error authorizing with Google Drive API: {auth_error}")
+            logger.error("Error authorizing with Google Drive API: %s", auth_error)
             raise SheetReadError(error_code="auth_error") from auth_error
 
         return ApiInstances(gspread=gc, drive=drive)
 
     except json.JSONDecodeError as json_error:
-        logger.error(f"Invalid JSON format in service account credentials: {json_error}")
+        logger.error("Invalid JSON format in service account credentials: %s", json_error)
         raise SheetReadError(error_code="auth_invalid_format") from json_error
     except gspread.exceptions.APIError as e:
-        logger.error(f"Google Sheets API error: {e}")
+        logger.error("Google Sheets API error: %s", e)
         raise SheetReadError(
             error_code="api_error",
             error_message=f"Received error {e.code} from Google Sheets API: {e.error['message']}",
         ) from e
     except GoogleHttpError as e:
-        logger.error(f"Google API error: {e}")
+        logger.error("Google API error: %s", e)
         raise SheetReadError(
             error_code="api_error", error_message=f"Received error {e.status_code} from Google API: {e.reason}"
         ) from e
     except requests.exceptions.RetryError as e:
-        logger.error(f"Reached maximum configured API retries: {e}")
+        logger.error("Reached maximum configured API retries: %s", e)
         raise SheetReadError(error_code="max_api_retries") from e
     except SheetReadError:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error initializing APIs with service account: {e}")
-        logger.error(f"Exception type: {type(e).__name__}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Unexpected error initializing APIs with service account (%s): %s", type(e).__name__, e)
         raise SheetReadError(error_code="api_error") from e
 
 
 def read_worksheets(
     sheet_id: str, spreadsheet_metadata: SpreadsheetMetadata, spreadsheet: gspread.Spreadsheet, sheet_indices: list[int]
 ) -> tuple[list[WorksheetInfo], list[gspread.Worksheet]]:
-    import logging
-
     logger = logging.getLogger(__name__)
 
     # Get list of worksheets
@@ -366,14 +433,13 @@ def read_worksheets(
     all_worksheets = spreadsheet.worksheets()
     worksheets: list[gspread.Worksheet] = []
 
-    logger.info(
-        f"Attempting to get worksheets of spreadsheet {sheet_id} at indices: {', '.join(str(i) for i in sheet_indices)}"
-    )
+    logger.info("Attempting to get worksheets of spreadsheet %s at indices: %s", sheet_id, sheet_indices)
     for sheet_index in sheet_indices:
         if not sheet_index < len(all_worksheets):
             logger.error(
-                f"Error accessing Google Sheet with service account: Worksheet index {sheet_index} not found in "
-                f"sheet {sheet_id}"
+                "Error accessing Google Sheet with service account: Worksheet index %s not found in sheet %s",
+                sheet_index,
+                sheet_id,
             )
             raise SheetReadError(error_code="worksheet_not_found", spreadsheet_metadata=spreadsheet_metadata)
         worksheets.append(all_worksheets[sheet_index])
@@ -394,13 +460,21 @@ def read_worksheets(
         data = gspread.utils.fill_gaps(value_range.get("values", [[]]))
         # Convert to DataFrame
         if len(data) >= 1:
-            logger.info(
-                f"Successfully retrieved data from worksheet index {sheet_index}: {len(data)} rows, "
-                f"{len(data[0]) if data[0] else 0} columns"
-            )
             source_columns = data[0]
             source_rows_start_index = 1
-            df = pd.DataFrame(data[source_rows_start_index:], columns=source_columns)  # First row as header
+            logger.info(
+                "Successfully retrieved data from worksheet index %s: %s rows, %s columns",
+                sheet_index,
+                len(data),
+                len(source_columns),
+            )
+            # Copy the values into an object array up front (the rows are rectangular after filling gaps), and
+            # construct the dataframe around it so that pandas doesn't convert the nested lists and copy them again
+            values = np.empty((len(data) - source_rows_start_index, len(source_columns)), dtype=object)
+            # A worksheet with only a header row has no values to copy, and can't be broadcast into the empty array
+            if len(values):
+                values[:] = data[source_rows_start_index:]
+            df = pd.DataFrame(values, columns=source_columns, copy=False)  # First row as header
             worksheets_info.append(
                 WorksheetInfo(
                     data=df,
@@ -410,7 +484,7 @@ def read_worksheets(
                 )
             )
         else:
-            logger.warning(f"Sheet {sheet_id} (index {sheet_index}) appears to be empty")
+            logger.warning("Sheet %s (index %s) appears to be empty", sheet_id, sheet_index)
             raise SheetReadError(
                 error_code="sheet_data_empty",
                 spreadsheet_metadata=spreadsheet_metadata,
@@ -441,12 +515,6 @@ def read_sheet_with_service_account(
     Raises:
         SheetReadError containing error code and, if available, sheet title and worksheet ID
     """
-    import logging
-    import traceback
-
-    import gspread
-    from googleapiclient.errors import HttpError as GoogleHttpError
-
     # Configure logging
     logger = logging.getLogger(__name__)
 
@@ -467,15 +535,15 @@ def read_sheet_with_service_account(
     try:
         try:
             # Open the spreadsheet and get the worksheets
-            logger.info(f"Attempting to open spreadsheet with ID: {sheet_id}")
+            logger.info("Attempting to open spreadsheet with ID: %s", sheet_id)
             spreadsheet = apis.gspread.open_by_key(sheet_id)
 
             # Get the spreadsheet title
             sheet_title = spreadsheet.title
-            logger.info(f"Successfully opened spreadsheet: '{sheet_title}'")
+            logger.info("Successfully opened spreadsheet: '%s'", sheet_title)
 
             # Get the spreadsheet metadata from Drive
-            logger.info(f"Attempting to get metadata for spreadsheet with ID: {sheet_id}")
+            logger.info("Attempting to get metadata for spreadsheet with ID: %s", sheet_id)
             file_metadata = (
                 apis.drive.files()
                 .get(
@@ -507,40 +575,39 @@ def read_sheet_with_service_account(
             return SpreadsheetInfo(spreadsheet_metadata, sheets_info), gspread_worksheets
 
         except gspread.exceptions.SpreadsheetNotFound as e:
-            logger.error(f"Sheet {sheet_id} not found. Check if the sheet ID is correct.")
+            logger.error("Sheet %s not found. Check if the sheet ID is correct.", sheet_id)
             logger.error(
-                f"Error accessing Google Sheet with service account: Sheet {sheet_id} not found or not accessible "
-                "with provided credentials"
+                "Error accessing Google Sheet with service account: Sheet %s not found or not accessible with "
+                "provided credentials",
+                sheet_id,
             )
             raise SheetReadError(error_code="sheet_not_found", spreadsheet_metadata=spreadsheet_metadata) from e
         except PermissionError as e:
-            logger.error(f"Permission denied accessing sheet {sheet_id}: {e}")
+            logger.error("Permission denied accessing sheet %s: %s", sheet_id, e)
             logger.error("Make sure the service account has access to the sheet.")
             raise SheetReadError(error_code="permission_denied", spreadsheet_metadata=spreadsheet_metadata) from e
         except gspread.exceptions.APIError as e:
-            logger.error(f"Google Sheets API error: {e}")
+            logger.error("Google Sheets API error: %s", e)
             raise SheetReadError(
                 error_code="api_error",
                 error_message=f"Received error {e.code} from Google Sheets API: {e.error['message']}",
                 spreadsheet_metadata=spreadsheet_metadata,
             ) from e
         except GoogleHttpError as e:
-            logger.error(f"Google API error: {e}")
+            logger.error("Google API error: %s", e)
             raise SheetReadError(
                 error_code="api_error",
                 error_message=f"Received error {e.status_code} from Google API: {e.reason}",
                 spreadsheet_metadata=spreadsheet_metadata,
             ) from e
         except requests.exceptions.RetryError as e:
-            logger.error(f"Reached maximum configured API retries: {e}")
+            logger.error("Reached maximum configured API retries: %s", e)
             raise SheetReadError(error_code="max_api_retries", spreadsheet_metadata=spreadsheet_metadata) from e
 
     except SheetReadError:
         raise
     except Exception as e:
-        logger.error(f"Unexpected error accessing Google Sheet with service account: {e}")
-        logger.error(f"Exception type: {type(e).__name__}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception("Unexpected error accessing Google Sheet with service account (%s): %s", type(e).__name__, e)
         raise SheetReadError(error_code="api_error", spreadsheet_metadata=spreadsheet_metadata) from e
 
 
@@ -551,41 +618,52 @@ def normalize_dataframe_values(df: pd.DataFrame, schemaview: SchemaView, class_n
 
     class_slots_by_name = {slot.name: slot for slot in schemaview.class_induced_slots(class_name)}
 
-    # An integer should consist of an optional negative sign, followed by either a nonzero number of non-separated
-    # digits,
-    # or 1-3 digits followed by a nonzero number of comma-separated three-digit groups
-    int_re = re.compile(r"^-?(?:\d+|\d{1,3}(?:,\d{3})+)$")
+    match_integer = integer_value_re.fullmatch
 
     def parse_int(value):
-        if int_re.fullmatch(value) is None:
+        if match_integer(value) is None:
             return value
         return int(value.replace(",", ""))
 
     def parse_list(value, parse_item):
-        return [parse_item(item.strip()) for item in value.split(";")] if value.strip() else []
+        # Values are only parsed once they've been found to be non-blank, so there's no need to strip them again here
+        return [parse_item(item.strip()) for item in value.split(";")]
 
-    def map_column(name):
+    def map_column(name, values):
         # Get slot info from schema if available
         slot = class_slots_by_name.get(name)
 
+        # Map over the column, converting whitespace-only value to None and parsing other values where applicable
+        # Use the Series constructor with a list comprehension to ensure that values are put directly into an object
+        # series and can't be cast by Pandas
+        is_integer = slot is not None and slot.range == "integer"
+        if not is_integer and (slot is None or not slot.multivalued):
+            # Columns whose values are kept as-is (including columns the schema doesn't recognize, which are still
+            # needed so that the validator can report them) don't need a parse call per value
+            return pd.Series([value if value.strip() else None for value in values], dtype="object", index=df.index)
+
         # Determine how to parse a non-empty value in this column
-        parse_value = parse_int if slot is not None and slot.range == "integer" else lambda v: v
-        if slot is not None and slot.multivalued:
+        parse_value = parse_int if is_integer else lambda v: v
+        if slot.multivalued:
             parse_item = parse_value
 
             def parse_value(v):
                 return parse_list(v, parse_item)
 
-        # Map over the column, converting whitespace-only value to None and parsing other values where applicable
-        # Use the Series constructor with a list comprehension to ensure that values are put directly into an object
-        # series and can't be cast by Pandas
         return pd.Series(
-            [None if value.strip() == "" else parse_value(value) for value in df[name]],
+            [parse_value(value) if value.strip() else None for value in values],
             dtype="object",
             index=df.index,
         )
 
-    return pd.DataFrame({name: map_column(name) for name in df.columns if name and name.strip() != ""})
+    # Go through the columns once, mapping over their underlying arrays rather than indexing the dataframe by name
+    return pd.DataFrame(
+        {
+            name: map_column(name, column.to_numpy(dtype=object, copy=False))
+            for name, column in df.items()
+            if name and name.strip()
+        }
+    )
 
 
 def make_summary_without_entities(
@@ -618,17 +696,15 @@ def make_validation_result_for_whole_sheet_error(
 def make_read_error_validation_result(
     sheet_id: str, entity_types: list[str], read_error: SheetReadError
 ) -> SheetValidationResult:
-    import logging
-
     logger = logging.getLogger()
 
     error_msg = (
         read_error.error_message
         or f"Could not access or read data from sheet {sheet_id} (Error: {read_error.error_code})"
     )
-    logger.warning(f"Sheet access failed with error code: {read_error.error_code}")
+    logger.warning("Sheet access failed with error code: %s", read_error.error_code)
 
-    logger.warning(f"{error_msg}")
+    logger.warning(error_msg)
     return make_validation_result_for_whole_sheet_error(
         sheet_id=sheet_id,
         entity_types=entity_types,
@@ -649,40 +725,141 @@ def handle_validation_error(
     row_index: int | MissingSentinel = MISSING,
     row_id: Any | MissingSentinel = MISSING,
 ):
-    for error in validation_error.errors():
-        # Update error count
-        validation_summary["error_count"] += 1
-
+    def make_error_info(error) -> SheetErrorInfo:
+        error_ctx = error.get("ctx", {})
         # Use row index from error if possible
-        error_row_index = error.get("ctx", {}).get("row_index", row_index)
+        error_row_index = error_ctx.get("row_index", row_index)
         if error_row_index is MISSING:
             raise ValueError(f"No row index provided for {entity_type} error {error}")
         # Use row ID from error if possible
-        error_row_id = error.get("ctx", {}).get("row_id", row_id)
+        error_row_id = error_ctx.get("row_id", row_id)
         if error_row_id is MISSING:
             raise ValueError(f"No row ID provided for {entity_type} error {error}")
         # Get field name if available
-        error_column_name = None if len(error["loc"]) == 0 else error["loc"][0]
-        # Get A1 if possible
+        error_column_name = error["loc"][0] if error["loc"] else None
+        return SheetErrorInfo(
+            entity_type=entity_type,
+            worksheet_id=sheet_info.worksheet_id,
+            message=error["msg"],
+            row=error_row_index,
+            column=error_column_name,
+            # Get A1 if possible
+            cell=sheet_info.find_a1(error_row_index, error_column_name),
+            primary_key=error_row_id,
+            input=error["input"],
+            # Leave empty to be potentially populated after the sheet has been fully processed by the validator
+            input_fix=None,
+        )
+
+    errors = validation_error.errors()
+    # Save error info to provided list
+    validation_errors_list.extend([make_error_info(error) for error in errors])
+    # Update error count
+    validation_summary["error_count"] += len(errors)
+
+
+def validate_worksheet_rows(
+    entity_type: str,
+    sheet_info: WorksheetInfo,
+    *,
+    class_name: str,
+    rows_to_validate_by_entity_type: dict[str, pd.DataFrame],
+    schemaview: SchemaView,
+    validation_summary: dict[str, int],
+    validation_errors: list[SheetErrorInfo],
+) -> bool:
+    """
+    Validate the normalized rows of a single worksheet.
+
+    Args:
+        entity_type: The entity type of the worksheet being validated
+        sheet_info: Info for the worksheet being validated, used to locate errors
+        class_name: Schema class name to validate the rows against
+        rows_to_validate_by_entity_type: Dict of normalized dataframes of rows to validate for all entity types, used
+            for checking references between entity types
+        schemaview: The schemaview to use to determine class and slot info
+        validation_summary: Validation summary whose error count is updated with the errors found
+        validation_errors: List that errors found in the worksheet are added to
+
+    Returns:
+        True if all rows in the worksheet are valid, False otherwise
+    """
+    logger = logging.getLogger()
+
+    # Note the number of errors already reported, to tell whether this worksheet adds any
+    initial_error_count = len(validation_errors)
+
+    # Get normalized dataframe of rows to validate
+    rows_to_validate = rows_to_validate_by_entity_type[entity_type]
+    # Validate uniqueness and report results
+    uniqueness_validation_error = validate_id_uniqueness(rows_to_validate, schemaview, class_name)
+    if uniqueness_validation_error:
+        handle_validation_error(
+            uniqueness_validation_error,
+            validation_summary=validation_summary,
+            validation_errors_list=validation_errors,
+            entity_type=entity_type,
+            sheet_info=sheet_info,
+        )
+    # Validate references and report results
+    references_validation_error = validate_referential_integrity(
+        rows_to_validate_by_entity_type, schemaview, class_name
+    )
+    if references_validation_error:
+        handle_validation_error(
+            references_validation_error,
+            validation_summary=validation_summary,
+            validation_errors_list=validation_errors,
+            entity_type=entity_type,
+            sheet_info=sheet_info,
+        )
+    # Look up the primary key field once for all of the rows
+    primary_key_field = sheet_structure_by_entity_type[entity_type]["primary_key_field"]
+
+    # Validate each row, building its dictionary directly from the row's values rather than going through a series
+    # per row; the values are already normalized Python objects, so they don't need to be converted
+    column_names = rows_to_validate.columns.tolist()
+    for row_index, *row_values in rows_to_validate.itertuples(index=True, name=None):
+        row_dict = dict(zip(column_names, row_values, strict=True))
+        primary_key_value = row_dict.get(primary_key_field, MISSING)
+        row_primary_key = None if primary_key_value is MISSING else f"{primary_key_field}:{primary_key_value}"
+
+        # Validate the data
         try:
-            error_a1 = sheet_info.get_a1(error_row_index, error_column_name)
-        except ValueError:
-            error_a1 = None
-        # Save error info to provided list
-        validation_errors_list.append(
-            SheetErrorInfo(
-                entity_type=entity_type,
-                worksheet_id=sheet_info.worksheet_id,
-                message=error["msg"],
-                row=error_row_index,
-                column=error_column_name,
-                cell=error_a1,
-                primary_key=error_row_id,
-                input=error["input"],
-                # Leave empty to be potentially populated after the sheet has been fully processed by the validator
-                input_fix=None,
+            validation_error = validate(row_dict, class_name=class_name)
+            # Report results
+            if validation_error:
+                handle_validation_error(
+                    validation_error,
+                    validation_summary=validation_summary,
+                    validation_errors_list=validation_errors,
+                    entity_type=entity_type,
+                    sheet_info=sheet_info,
+                    row_index=row_index,
+                    row_id=row_primary_key,
+                )
+        except Exception as e:
+            validation_summary["error_count"] += 1
+            # Store error info
+            validation_errors.append(
+                SheetErrorInfo(
+                    entity_type=entity_type,
+                    worksheet_id=sheet_info.worksheet_id,
+                    message=str(e),
+                    row=row_index,
+                    primary_key=row_primary_key,
+                )
             )
-        )
+
+    all_valid = len(validation_errors) == initial_error_count
+    if all_valid:
+        logger.info("All %d %s rows are valid!", len(rows_to_validate), entity_type)
+    else:
+        logger.warning("Validation found errors in some of the %d %s rows.", len(rows_to_validate), entity_type)
+        logger.warning("Please check the schema requirements and update the data accordingly.")
+        logger.info("Schema location: %s", Path(__file__).parent / f"../../schema/{entity_type}.yaml")
+
+    return all_valid
 
 
 def validate_google_sheet(
@@ -716,22 +893,14 @@ def validate_google_sheet(
     if bionetwork is not None and bionetwork not in allowed_bionetwork_names:
         raise ValueError(f"'{bionetwork}' is not a valid bionetwork")
 
-    import logging
-
-    from hca_validation.schema_utils import get_entity_class_name, load_schemaview
-    from hca_validation.validator import validate, validate_id_uniqueness, validate_referential_integrity
-
     logger = logging.getLogger()
 
     invalid_entity_types = [t for t in entity_types if t not in sheet_structure_by_entity_type]
     if invalid_entity_types:
         raise ValueError(f"Invalid entity types: {', '.join(invalid_entity_types)}")
 
-    # Load schema for use in interpreting and validating input values
-    schemaview = load_schemaview()
-
     if sheet_read_result is None:
-        logger.info(f"Reading sheet: {sheet_id}")
+        logger.info("Reading sheet: %s", sheet_id)
         try:
             # Read the sheet with service account credentials
             sheet_read_result = read_sheet_with_service_account(sheet_id, entity_types, apis)[0]
@@ -741,6 +910,10 @@ def validate_google_sheet(
     # Mapping from entity type to dataframe of rows to validate, with normalized values, and an index containing
     # the original 1-based indices of the rows
     rows_to_validate_by_entity_type = {}
+    # Mapping from entity type to the name of the schema class its rows are validated against
+    class_name_by_entity_type = {
+        entity_type: get_entity_class_name(entity_type, bionetwork) for entity_type in entity_types
+    }
 
     for entity_type, sheet_info in zip(entity_types, sheet_read_result.worksheets, strict=True):
         df = sheet_info.data
@@ -750,55 +923,42 @@ def validate_google_sheet(
             df = df.iloc[:, 1:]
 
         # Print information about the sheet structure
-        logger.info(f"Sheet has {len(df)} {entity_type} rows total")
-
-        # Find rows with actual data to validate
-        row_indices = []
+        logger.info("Sheet has %d %s rows total", len(df), entity_type)
 
-        # Debug: Print the first few rows to understand the structure
-        logger.debug("Sheet structure:")
-        for i in range(min(10, len(df))):
-            if i < len(df):
-                first_col = df.iloc[i, 0] if not pd.isna(df.iloc[i, 0]) else "<empty>"
-                logger.debug(f"Row {i + 1} (index {i}): {first_col}")
+        # Debug: Print the first few rows to understand the structure, only looking them up if they'll be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sheet structure:")
+            for i, first_col in enumerate(df.iloc[:10, 0].tolist() if len(df.columns) else []):
+                logger.debug("Row %d (index %d): %s", i + 1, i, "<empty>" if pd.isna(first_col) else first_col)
 
         # Process from row 6 until the first empty row
         start_row_index = 4  # Row 6 (1-based including header) is index 4 (0-based excluding header)
-        current_row_index = start_row_index
-
-        logger.info(f"Processing {entity_type} data rows starting from row 6 (index {start_row_index})...")
-
-        while current_row_index < len(df):
-            # Get the current row
-            row = df.iloc[current_row_index]
-
-            # Check if row is empty (all values are NaN or empty strings)
-            is_empty = row.isna().all() or all(str(val).strip() == "" for val in row if not pd.isna(val))
-
-            if is_empty:
-                # Stop at the first empty row
-                logger.debug(f"Found empty row at row {current_row_index + 1}, stopping")
-                break
 
-            # Add non-empty row for validation
-            logger.debug(f"Adding row {current_row_index + 1} for validation")
-            row_indices.append(current_row_index)
-
-            # Move to the next row
-            current_row_index += 1
-
-        logger.info(f"Found {len(row_indices)} {entity_type} rows to validate.")
-
-        # Set the dataframe index to 1-based indices
-        df = df.reset_index(drop=True)
-        df.index += 1
+        # Check all candidate rows for emptiness (all values are NaN or empty strings) at once, using per-column string
+        # operations so that each cell is stripped as its own object rather than padded to the longest cell's width
+        candidate_rows = df.iloc[start_row_index:]
+        stripped_values = candidate_rows.astype(str).apply(lambda column: column.str.strip())
+        is_empty_row = (candidate_rows.isna() | (stripped_values == "")).all(axis=1).to_numpy()
+
+        # Stop at the first empty row
+        end_row_index = start_row_index + (int(is_empty_row.argmax()) if is_empty_row.any() else len(is_empty_row))
+
+        # Log a single summary of the rows found, using sheet row numbers (index 0 is row 2, after the header)
+        logger.info(
+            "Found %d %s rows to validate starting from row 6 (stopped at %s)",
+            end_row_index - start_row_index,
+            entity_type,
+            f"empty row {end_row_index + 2}" if end_row_index < len(df) else "end of sheet",
+        )
 
-        # Get the subset of rows that should be validated
-        source_rows_to_validate = df.iloc[row_indices]
+        # Get the subset of rows that should be validated, indexed by their 1-based indices in the full dataframe
+        source_rows_to_validate = df.iloc[start_row_index:end_row_index].set_axis(
+            pd.RangeIndex(start_row_index + 1, end_row_index + 1)
+        )
 
         # Save the dataframe with normalized values
         rows_to_validate_by_entity_type[entity_type] = normalize_dataframe_values(
-            source_rows_to_validate, schemaview, get_entity_class_name(entity_type, bionetwork)
+            source_rows_to_validate, hca_schemaview, class_name_by_entity_type[entity_type]
         )
 
     # Set up validation summary with entity counts and initial error count
@@ -836,87 +996,23 @@ def validate_google_sheet(
 
     all_valid = True
 
+    # Validate each entity type's rows in order
     for entity_type, sheet_info in zip(entity_types, sheet_read_result.worksheets, strict=True):
-        # Determine schema class name to use for validation
-        class_name = get_entity_class_name(entity_type, bionetwork)
-        # Get normalized dataframe of rows to validate
-        rows_to_validate = rows_to_validate_by_entity_type[entity_type]
-        all_valid_in_worksheet = True
-        # Validate uniqueness and report results
-        uniqueness_validation_error = validate_id_uniqueness(rows_to_validate, schemaview, class_name)
-        if uniqueness_validation_error:
-            all_valid_in_worksheet = False
-            handle_validation_error(
-                uniqueness_validation_error,
-                validation_summary=validation_summary,
-                validation_errors_list=validation_errors,
-                entity_type=entity_type,
-                sheet_info=sheet_info,
-            )
-        # Validate references and report results
-        references_validation_error = validate_referential_integrity(
-            rows_to_validate_by_entity_type, schemaview, class_name
+        all_valid_in_worksheet = validate_worksheet_rows(
+            entity_type,
+            sheet_info,
+            class_name=class_name_by_entity_type[entity_type],
+            rows_to_validate_by_entity_type=rows_to_validate_by_entity_type,
+            schemaview=hca_schemaview,
+            validation_summary=validation_summary,
+            validation_errors=validation_errors,
         )
-        if references_validation_error:
-            all_valid_in_worksheet = False
-            handle_validation_error(
-                references_validation_error,
-                validation_summary=validation_summary,
-                validation_errors_list=validation_errors,
-                entity_type=entity_type,
-                sheet_info=sheet_info,
-            )
-        # Validate each row
-        for row_index, row in rows_to_validate.iterrows():
-            # Convert row to dictionary
-            row_dict = row.to_dict()
-
-            primary_key_field = sheet_structure_by_entity_type[entity_type]["primary_key_field"]
-            row_primary_key = (
-                f"{primary_key_field}:{row_dict[primary_key_field]}" if primary_key_field in row_dict else None
-            )
-
-            # Validate the data
-            try:
-                validation_error = validate(row_dict, class_name=class_name)
-                # Report results
-                if validation_error:
-                    all_valid_in_worksheet = False
-                    handle_validation_error(
-                        validation_error,
-                        validation_summary=validation_summary,
-                        validation_errors_list=validation_errors,
-                        entity_type=entity_type,
-                        sheet_info=sheet_info,
-                        row_index=row_index,
-                        row_id=row_primary_key,
-                    )
-            except Exception as e:
-                all_valid_in_worksheet = False
-                # Update error count
-                validation_summary["error_count"] += 1
-                # Store error info
-                validation_errors.append(
-                    SheetErrorInfo(
-                        entity_type=entity_type,
-                        worksheet_id=sheet_info.worksheet_id,
-                        message=str(e),
-                        row=row_index,
-                        primary_key=row_primary_key,
-                    )
-                )
-
-        if all_valid_in_worksheet:
-            logger.info(f"All {len(rows_to_validate)} {entity_type} rows are valid!")
-        else:
+        if not all_valid_in_worksheet:
             all_valid = False
-            logger.warning(f"Validation found errors in some of the {len(rows_to_validate)} {entity_type} rows.")
-            logger.warning("Please check the schema requirements and update the data accordingly.")
-            logger.info(f"Schema location: {Path(__file__).parent / f'../../schema/{entity_type}.yaml'}")
 
     # Summary
     if all_valid:
-        logger.info(f"All rows for the {len(entity_types)} specified entity types are valid!")
+        logger.info("All rows for the %d specified entity types are valid!", len(entity_types))
         return SheetValidationResult(
             successful=True,
             spreadsheet_metadata=sheet_read_result.spreadsheet_metadata,
@@ -924,7 +1020,7 @@ def validate_google_sheet(
             summary=validation_summary,
             errors=validation_errors,
         )
-    logger.warning(f"Validation found errors in some of the {len(entity_types)} entity types.")
+    logger.warning("Validation found errors in some of the %d entity types.", len(entity_types))
     return SheetValidationResult(
         successful=False,
         spreadsheet_metadata=sheet_read_result.spreadsheet_metadata,
@@ -10,6 +10,7 @@ This script tests the functionality of the entry sheet validator, including:
 
 import json
 import os
+import tracemalloc
 from pathlib import Path
 from unittest.mock import DEFAULT, MagicMock, patch
 
@@ -27,6 +28,7 @@ from hca_validation.entry_sheet_validator.validate_sheet import (
     SpreadsheetInfo,
     SpreadsheetMetadata,
     WorksheetInfo,
+    create_apis,
     read_sheet_with_service_account,
     validate_google_sheet,
 )
@@ -289,9 +291,38 @@ def _test_validation_with_mock_sheets_response(
     return validation_result
 
 
+class TestWorksheetInfo:
+    """Tests for the WorksheetInfo class."""
+
+    def test_get_a1(self):
+        """Test A1 notation lookup, including multi-letter columns and repeated column names."""
+        source_columns = ["", *(f"column{i}" for i in range(1, 30)), "column1"]
+        sheet_info = WorksheetInfo(
+            data=pd.DataFrame(),
+            worksheet_id=123,
+            source_columns=source_columns,
+            source_rows_start_index=1,
+        )
+        assert sheet_info.get_a1(5, "") == "A6"
+        assert sheet_info.get_a1(5, "column1") == "B6"
+        assert sheet_info.get_a1(1, "column26") == "AA2"
+        assert sheet_info.get_a1(10, "column29") == "AD11"
+        with pytest.raises(ValueError):
+            sheet_info.get_a1(5, "not_a_column")
+        with pytest.raises(ValueError):
+            sheet_info.get_a1(5, None)
+
+
 class TestReadSheetWithServiceAccount:
     """Tests for the read_sheet_with_service_account function."""
 
+    @pytest.fixture(autouse=True)
+    def clear_api_cache(self):
+        """Fixture to keep API instances created in one test from being reused in another."""
+        create_apis.cache_clear()
+        yield
+        create_apis.cache_clear()
+
     @pytest.fixture
     def mock_env_with_credentials(self):
         """Fixture to mock environment with service account credentials."""
@@ -404,6 +435,65 @@ class TestReadSheetWithServiceAccount:
         # Expect values_batch_get to have been called with a range consisting of the quoted worksheet title
         mock_sheet.values_batch_get.assert_called_once_with(["'Test Worksheet'"])
 
+    @patch("googleapiclient.discovery.build")
+    @patch("hca_validation.entry_sheet_validator.validate_sheet.create_requests_session")
+    @patch("gspread.authorize")
+    @patch("google.oauth2.service_account.Credentials.from_service_account_info")
+    def test_header_only_worksheet(
+        self,
+        mock_credentials,
+        mock_authorize,
+        mock_create_requests_session,
+        mock_build,
+        mock_env_with_credentials,
+    ):
+        """Test reading a worksheet that contains only a header row."""
+        mock_client = MagicMock()
+        mock_authorize.return_value = mock_client
+        mock_drive = MagicMock()
+        mock_build.return_value = mock_drive
+
+        mock_sheet = self._mock_api_outputs(mock_client, mock_drive)
+        mock_sheet.values_batch_get.return_value = {"valueRanges": [{"values": [["header1", "header2"]]}]}
+
+        # The worksheet should be read as an empty dataframe with the header columns
+        sheet_info = read_sheet_with_service_account(PUBLIC_SHEET_ID)[0].worksheets[0]
+        assert isinstance(sheet_info.data, pd.DataFrame)
+        assert sheet_info.data.empty
+        assert list(sheet_info.data.columns) == ["header1", "header2"]
+        assert sheet_info.source_columns == ["header1", "header2"]
+
+    @patch("googleapiclient.discovery.build")
+    @patch("hca_validation.entry_sheet_validator.validate_sheet.create_requests_session")
+    @patch("gspread.authorize")
+    @patch("google.oauth2.service_account.Credentials.from_service_account_info")
+    def test_reuse_apis_for_same_credentials(
+        self,
+        mock_credentials,
+        mock_authorize,
+        mock_create_requests_session,
+        mock_build,
+        mock_env_with_credentials,
+    ):
+        """Test that API instances are reused across reads with the same service account credentials."""
+        mock_client = MagicMock()
+        mock_authorize.return_value = mock_client
+        mock_drive = MagicMock()
+        mock_build.return_value = mock_drive
+
+        mock_sheet = self._mock_api_outputs(mock_client, mock_drive)
+
+        # Read the sheet twice
+        read_sheet_with_service_account(PUBLIC_SHEET_ID)
+        read_sheet_with_service_account(PUBLIC_SHEET_ID)
+
+        # Verify the credentials and clients were only created once, but were used for both reads
+        mock_credentials.assert_called_once()
+        mock_authorize.assert_called_once()
+        mock_build.assert_called_once()
+        assert mock_client.open_by_key.call_count == 2
+        assert mock_sheet.values_batch_get.call_count == 2
+
     @patch("googleapiclient.discovery.build")
     @patch("hca_validation.entry_sheet_validator.validate_sheet.create_requests_session")
     @patch("gspread.authorize")
@@ -448,6 +538,7 @@ class TestReadSheetWithServiceAccount:
         assert error_info.value.error_code == "auth_missing"
         assert error_info.value.spreadsheet_metadata is None
         assert error_info.value.worksheet_id is None
+        assert str(error_info.value) == "auth_missing"
 
     def test_with_unresolved_credentials(self):
         """Test reading a sheet with unresolved credentials from Secrets Manager."""
@@ -484,7 +575,7 @@ class TestReadSheetWithServiceAccount:
         }
     )
 
-    @patch("requests.get")
+    @patch("hca_validation.entry_sheet_validator.validate_sheet.secrets_extension_session.get")
     @patch("googleapiclient.discovery.build")
     @patch("hca_validation.entry_sheet_validator.validate_sheet.create_requests_session")
     @patch("gspread.authorize")
@@ -495,7 +586,7 @@ class TestReadSheetWithServiceAccount:
         mock_authorize,
         mock_create_requests_session,
         mock_build,
-        mock_requests_get,
+        mock_session_get,
     ):
         """In a Lambda env, credentials come from the Secrets Extension (localhost:2773), not the env fallback.
 
@@ -515,7 +606,7 @@ class TestReadSheetWithServiceAccount:
         # Mock the extension's HTTP response: raise_for_status is a no-op, json() carries the SecretString.
         mock_response = MagicMock()
         mock_response.json.return_value = {"SecretString": self._EXTENSION_SECRET_JSON}
-        mock_requests_get.return_value = mock_response
+        mock_session_get.return_value = mock_response
 
         # Mock the downstream Google clients so the read proceeds without real network.
         mock_client = MagicMock()
@@ -529,8 +620,8 @@ class TestReadSheetWithServiceAccount:
             assert isinstance(sheet_read_result, SpreadsheetInfo)
 
             # The extension was queried with the session token and the environment-derived secret id.
-            mock_requests_get.assert_called_once()
-            call = mock_requests_get.call_args
+            mock_session_get.assert_called_once()
+            call = mock_session_get.call_args
             assert "dev/hca-atlas-tracker/google-service-account" in call.args[0]
             assert call.kwargs["headers"]["X-Aws-Parameters-Secrets-Token"] == "test-session-token"
 
@@ -544,8 +635,8 @@ class TestReadSheetWithServiceAccount:
             os.environ.clear()
             os.environ.update(original_env)
 
-    @patch("requests.get")
-    def test_with_extension_request_failure(self, mock_requests_get):
+    @patch("hca_validation.entry_sheet_validator.validate_sheet.secrets_extension_session.get")
+    def test_with_extension_request_failure(self, mock_session_get):
         """If the extension call fails in a Lambda env, get_secret_from_extension returns None and init_apis
         falls back to GOOGLE_SERVICE_ACCOUNT — here an unresolved reference, yielding `auth_unresolved`."""
         original_env = os.environ.copy()
@@ -553,13 +644,13 @@ class TestReadSheetWithServiceAccount:
         os.environ["AWS_SESSION_TOKEN"] = "test-session-token"
         os.environ["GOOGLE_SERVICE_ACCOUNT"] = "aws:secretsmanager:dev/hca-atlas-tracker/google-service-account"
 
-        mock_requests_get.side_effect = RuntimeError("extension unreachable")
+        mock_session_get.side_effect = RuntimeError("extension unreachable")
 
         try:
             with pytest.raises(SheetReadError) as error_info:
                 read_sheet_with_service_account(PUBLIC_SHEET_ID)
             assert error_info.value.error_code == "auth_unresolved"
-            mock_requests_get.assert_called_once()
+            mock_session_get.assert_called_once()
         finally:
             os.environ.clear()
             os.environ.update(original_env)
@@ -724,7 +815,7 @@ class TestValidateGoogleSheet:
         # but not by the default model
         assert any(error.column == "doublet_detection" for error in result.errors)
 
-    @patch("hca_validation.validator.validate")
+    @patch("hca_validation.entry_sheet_validator.validate_sheet.validate")
     @patch("hca_validation.entry_sheet_validator.validate_sheet.read_sheet_with_service_account")
     def test_row_normalization_before_validation(self, mock_read_service_account, mock_validate):
         """Test normalization of rows passed to the validation function."""
@@ -743,7 +834,49 @@ class TestValidateGoogleSheet:
         # Confirm that values were converted as expected
         assert validated_dicts == SAMPLE_SHEET_DATA_WITH_CASTS_EXPECTED_NORMALIZATION
 
-    @patch("hca_validation.validator.validate")
+    @patch("hca_validation.entry_sheet_validator.validate_sheet.validate")
+    @patch("hca_validation.entry_sheet_validator.validate_sheet.read_sheet_with_service_account")
+    def test_long_cell_in_rows(self, mock_read_service_account, mock_validate):
+        """Test that one long cell doesn't inflate the memory used to find the rows to validate."""
+        # Build 300 rows of 80 columns, with empty header rows, one 2,000-character cell, and an empty row at index 200
+        columns = [f"column{i}" for i in range(80)]
+        rows = [[""] * len(columns) for _ in range(4)]
+        rows.extend([f"value{row}_{column}" for column in range(len(columns))] for row in range(4, 300))
+        rows[10][5] = "x" * 2000
+        rows[200] = [" "] * len(columns)
+        sheet_data = pd.DataFrame(rows, columns=columns)
+
+        validated_dicts = []
+
+        def save_data(data, class_name):
+            validated_dicts.append(data)
+            return DEFAULT
+
+        mock_validate.side_effect = save_data
+
+        # Validate once before tracing, so that one-time setup such as schema slot lookups isn't measured
+        _test_validation_with_mock_sheets_response(
+            validate_google_sheet, mock_read_service_account, sheet_data=sheet_data
+        )
+        mock_read_service_account.reset_mock()
+        validated_dicts.clear()
+
+        tracemalloc.start()
+        try:
+            _test_validation_with_mock_sheets_response(
+                validate_google_sheet, mock_read_service_account, sheet_data=sheet_data
+            )
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # Confirm that rows were validated up to the empty row, including the one with the long cell
+        assert len(validated_dicts) == 196
+        assert validated_dicts[6]["column5"] == "x" * 2000
+        # Padding every cell to the long cell's width would take hundreds of MB
+        assert peak_memory < 64 * 1024 * 1024
+
+    @patch("hca_validation.entry_sheet_validator.validate_sheet.validate")
     @patch("hca_validation.entry_sheet_validator.validate_sheet.read_sheet_with_service_account")
     def test_int_normalization_before_validation(self, mock_read_service_account, mock_validate):
         """Test normalization of integer fields passed to the validation function."""
@@ -765,7 +898,7 @@ class TestValidateGoogleSheet:
         # Confirm that values were converted as expected
         assert validated_dicts == SAMPLE_SHEET_DATA_WITH_INTEGERS_EXPECTED_NORMALIZATION
 
-    @patch("hca_validation.validator.validate")
+    @patch("hca_validation.entry_sheet_validator.validate_sheet.validate")
     @patch("hca_validation.entry_sheet_validator.validate_sheet.read_sheet_with_service_account")
     def test_valid_and_missing_int_normalization_before_validation(self, mock_read_service_account, mock_validate):
         """Test normalization of integer fields passed to the validation function, with only valid and missing
@@ -788,7 +921,7 @@ class TestValidateGoogleSheet:
         # Confirm that values were converted as expected
         assert validated_dicts == SAMPLE_SHEET_DATA_WITH_VALID_AND_MISSING_INTEGERS_EXPECTED_NORMALIZATION
 
-    @patch("hca_validation.validator.validate")
+    @patch("hca_validation.entry_sheet_validator.validate_sheet.validate")
     @patch("hca_validation.entry_sheet_validator.validate_sheet.read_sheet_with_service_account")
     def test_class_name(self, mock_read_service_account, mock_validate):
         """Test that the correct class name is passed to the validation function."""
@@ -851,6 +984,20 @@ class TestValidateGoogleSheet:
         assert len(samples_reference_errors) == 4
         assert all(error.column == "donor_id" for error in samples_reference_errors)
 
+    @patch("hca_validation.entry_sheet_validator.validate_sheet.read_sheet_with_service_account")
+    def test_errors_ordered_by_entity_type(self, mock_read_service_account):
+        """Test that errors from multiple worksheets are reported in entity type order."""
+        result = _test_validation_with_mock_sheets_response(
+            validate_google_sheet,
+            mock_read_service_account,
+            datasets_sheet_data=SAMPLE_DATASETS_SHEET_DATA_WITH_REFERENCES,
+            donors_sheet_data=SAMPLE_DONORS_SHEET_DATA_WITH_REFERENCES,
+            samples_sheet_data=SAMPLE_SAMPLES_SHEET_DATA_WITH_REFERENCES,
+        )
+        error_entity_type_positions = [default_entity_types.index(error.entity_type) for error in result.errors]
+        assert error_entity_type_positions == sorted(error_entity_type_positions)
+        assert result.summary["error_count"] == len(result.errors)
+
     @patch("hca_validation.entry_sheet_validator.validate_sheet.read_sheet_with_service_account")
     def test_available_fixes(self, mock_read_service_account):
         """Test that validate_google_sheet does not provide fixes on its own."""